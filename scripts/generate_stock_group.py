@@ -7,12 +7,16 @@
 """
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple
 
 TOPIC_DIRS: List[str] = ["topics-json", "topics-jsons"]
+# 股票组与别名支持的字段名，按优先级排列
+STOCK_LIST_KEYS: Tuple[str, ...] = ("stocks", "股票组", "list", "items", "content")
+ALIAS_KEYS: Tuple[str, ...] = ("aliases", "alias")
 
 
 def run_generate_topics_jsons() -> None:
@@ -23,6 +27,22 @@ def run_generate_topics_jsons() -> None:
     subprocess.run([sys.executable, str(script)], check=True, cwd=repo_root)
 
 
+def iter_files(root: str, suffix: str) -> Iterator[str]:
+    """
+    递归遍历目录，按 rglob 相同的顺序返回指定后缀的文件路径。
+    直接使用 os.scandir，避免为每个目录项构造 Path 对象。
+    """
+    subdirs: List[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(suffix):
+                yield entry.path
+    for subdir in subdirs:
+        yield from iter_files(subdir, suffix)
+
+
 def load_json_files(topic_dir: str) -> Dict[str, Any]:
     """
     加载题材目录下的所有JSON文件并生成stockGroup结构
@@ -41,13 +61,14 @@ def load_json_files(topic_dir: str) -> Dict[str, Any]:
     stock_group = {}
     
     # 遍历目录下的所有JSON文件（包括子目录）
-    for json_file in topic_path.rglob("*.json"):
+    for json_file in iter_files(topic_dir, ".json"):
         # 文件名（不含扩展名）作为题材名称
-        topic_name = json_file.stem
+        topic_name = os.path.splitext(os.path.basename(json_file))[0]
         
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 按字节读取后直接解析，json.loads 会自行识别 UTF-8
+            with open(json_file, 'rb') as f:
+                data = json.loads(f.read())
             
             # 如果data已经是列表格式（旧格式），直接使用
             if isinstance(data, list):
@@ -58,18 +79,22 @@ def load_json_files(topic_dir: str) -> Dict[str, Any]:
                 main_name = data.get('name') or topic_name
                 
                 # 获取alias（支持多种字段名）
-                aliases = data.get('aliases') or data.get('alias') or []
-                if isinstance(aliases, str):
+                aliases = None
+                for key in ALIAS_KEYS:
+                    aliases = data.get(key)
+                    if aliases:
+                        break
+                if not aliases:
+                    aliases = []
+                elif isinstance(aliases, str):
                     aliases = [aliases]
                 
                 # 尝试获取股票组字段（可能是多种命名）
-                stock_list = (
-                    data.get('stocks') or 
-                    data.get('股票组') or 
-                    data.get('list') or 
-                    data.get('items') or 
-                    data.get('content')
-                )
+                stock_list = None
+                for key in STOCK_LIST_KEYS:
+                    stock_list = data.get(key)
+                    if stock_list:
+                        break
                 
                 if stock_list and isinstance(stock_list, list):
                     # 添加主组（使用文件名或name字段）
@@ -91,6 +116,26 @@ def load_json_files(topic_dir: str) -> Dict[str, Any]:
     
     return stock_group
 
+def dumps_stock_group(stock_group: Dict[str, Any]) -> str:
+    """
+    序列化stockGroup，输出与 json.dumps(indent=4, ensure_ascii=False) 一致。
+    别名与主组共享同一个列表对象，按 id 缓存后每个列表只序列化一次。
+    """
+    if not stock_group:
+        return "{}"
+
+    cache: Dict[int, str] = {}
+    entries: List[str] = []
+    for name, value in stock_group.items():
+        text = cache.get(id(value))
+        if text is None:
+            # 值位于第二层，需要整体多缩进一级
+            text = json.dumps(value, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+            cache[id(value)] = text
+        entries.append(f"    {json.dumps(name, ensure_ascii=False)}: {text}")
+    return "{\n" + ",\n".join(entries) + "\n}"
+
+
 def main():
     run_generate_topics_jsons()
 
@@ -110,9 +155,10 @@ def main():
     # 排序确保输出顺序一致
     sorted_stock_group = dict(sorted(stock_group.items()))
     
-    # 写入输出文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(sorted_stock_group, f, ensure_ascii=False, indent=4)
+    # 一次性序列化并以二进制写入，避免文本流逐块编码
+    data = dumps_stock_group(sorted_stock_group)
+    with open(output_file, 'wb') as f:
+        f.write(data.encode('utf-8'))
     
     print(f"成功生成 {output_file}")
     print(f"共包含 {len(sorted_stock_group)} 个题材")
@@ -20,7 +20,7 @@ Markdown 格式：
 import json
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 FENCE_RE = re.compile(
     r"^```(stock|alias)\s*\n(.*?)(?:\n)?^```",
@@ -28,26 +28,29 @@ FENCE_RE = re.compile(
 )
 
 
-def parse_fence_lines(content: str, lang: str) -> List[str]:
-    """提取指定语言代码块中的非空行，去重并保留首次出现顺序。"""
-    items: List[str] = []
-    seen: set[str] = set()
+def parse_fences(content: str) -> Dict[str, List[str]]:
+    """单次扫描提取各语言代码块中的非空行，去重并保留首次出现顺序。"""
+    items: Dict[str, List[str]] = {"alias": [], "stock": []}
+    # 没有任何代码块时无需进入正则扫描
+    if "```" not in content:
+        return items
+    seen: Dict[str, set[str]] = {"alias": set(), "stock": set()}
     for match in FENCE_RE.finditer(content):
-        if match.group(1) != lang:
-            continue
+        lang = match.group(1)
+        lang_items = items[lang]
+        lang_seen = seen[lang]
         for line in match.group(2).splitlines():
             name = line.strip()
-            if name and name not in seen:
-                seen.add(name)
-                items.append(name)
+            if name and name not in lang_seen:
+                lang_seen.add(name)
+                lang_items.append(name)
     return items
 
 
 def parse_topic_md(content: str) -> Tuple[List[str], List[str]]:
     """解析题材 Markdown，返回 (别名列表, 股票列表)。"""
-    aliases = parse_fence_lines(content, "alias")
-    stocks = parse_fence_lines(content, "stock")
-    return aliases, stocks
+    items = parse_fences(content)
+    return items["alias"], items["stock"]
 
 
 def md_to_json_data(content: str) -> dict:
@@ -67,13 +70,13 @@ def generate_topics_jsons(md_dir: Path, json_dir: Path) -> int:
         json_file = json_dir / relative.with_suffix(".json")
 
         try:
-            content = md_file.read_text(encoding="utf-8")
+            content = md_file.read_bytes().decode("utf-8")
             data = md_to_json_data(content)
 
             json_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-                f.write("\n")
+            text = json.dumps(data, ensure_ascii=False, indent=4) + "\n"
+            with open(json_file, "wb") as f:
+                f.write(text.encode("utf-8"))
 
             print(f"生成: {json_file} ({len(data['stocks'])} 只股票)")
             count += 1